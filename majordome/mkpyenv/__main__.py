@@ -16,12 +16,13 @@ def main():
 
     config = {}
     if args.config is not None:
-        if not Path(args.config).exists():
+        try:
+            raw = Path(args.config).read_bytes()
+        except FileNotFoundError:
             print(f'Invalid configuration file: {args.config}')
             return 1
 
-        with open(args.config) as fp:
-            config = json.load(fp)
+        config = json.loads(raw)
 
     Manager(config).build()
     return 0
@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+from majordome.units import FlowUnits
+import numpy as np
+
+
+def test_flow_units_reference_values():
+    """ Pin conversions to values of the ideal gas formulas. """
+    units = FlowUnits()
+    assert units.P_STANDARD == 101325.0
+    assert np.isclose(units.normal_concentration, 0.04229254, rtol=1e-7)
+
+    speed = units.standard_flow_to_gas_speed(37, 900, 5e4, 0.01)
+    assert np.isclose(speed, 4.117545e-04, rtol=1e-6)
+
+
+def test_flow_units_array_matches_scalar():
+    """ Convert a sweep of operating points in a single call. """
+    units = FlowUnits()
+    q = np.array([10.0, 50.0, 100.0])
+    T = np.array([300.0, 800.0, 1200.0])
+
+    speed = units.standard_flow_to_gas_speed(q, T_work=T)
+    expect = [units.standard_flow_to_gas_speed(qi, T_work=Ti)
+              for qi, Ti in zip(q, T)]
+    assert np.allclose(speed, expect)
+
+    mass = units.normal_flow_to_mass_flow(q, 28.0)
+    expect = [units.normal_flow_to_mass_flow(qi, 28.0) for qi in q]
+    assert np.allclose(mass, expect)
+
+
+def test_flow_units_broadcast_mixed_arguments():
+    """ Broadcast mixed array and scalar arguments against known values. """
+    units = FlowUnits()
+
+    mass = units.normal_flow_to_mass_flow(36.0, np.array([28.0, 44.0]))
+    assert np.allclose(mass, [1.18419e-02, 1.86087e-02], rtol=1e-5)
+
+    P = np.array([5.0e+04, 1.0e+05])
+    A = np.array([0.01, 0.02])
+    speed = units.standard_flow_to_gas_speed(37.0, 900.0, P, A)
+    assert np.allclose(speed, [4.11755e-04, 1.02939e-04], rtol=1e-5)
+
+
+def test_flow_units_reference_overrides():
+    """ Reference conditions are honored when subclassed or reassigned. """
+    class WarmUnits(FlowUnits):
+        T_NORMAL = 300.0
+
+    assert np.isclose(WarmUnits().normal_concentration, 0.0406220, rtol=1e-5)
+    assert np.isclose(FlowUnits().normal_concentration, 0.0422925, rtol=1e-5)
+
+    T_NORMAL = FlowUnits.T_NORMAL
+    P_STANDARD = FlowUnits.P_STANDARD
+    try:
+        FlowUnits.T_NORMAL = 300.0
+        assert np.isclose(FlowUnits().normal_concentration, 0.0406220,
+                          rtol=1e-5)
+
+        FlowUnits.P_STANDARD = 2 * P_STANDARD
+        speed = FlowUnits().standard_flow_to_gas_speed(37, 900, 5e4, 0.01)
+        assert np.isclose(speed, 2 * 4.1175e-04, rtol=1e-4)
+    finally:
+        FlowUnits.T_NORMAL = T_NORMAL
+        FlowUnits.P_STANDARD = P_STANDARD
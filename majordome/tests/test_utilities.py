@@ -0,0 +1,16 @@
+# -*- coding: utf-8 -*-
+from majordome.utilities import Capturing
+import sys
+
+
+def test_capturing_stdout_stderr():
+    """ Capture both streams and restore them on exit. """
+    stdout, stderr = sys.stdout, sys.stderr
+
+    with Capturing() as output:
+        print("line 1\nline 2")
+        print("error", file=sys.stderr)
+
+    assert output == ["line 1", "line 2", "error"]
+    assert sys.stdout is stdout
+    assert sys.stderr is stderr
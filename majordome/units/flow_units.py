@@ -1,6 +1,15 @@
 # -*- coding: utf-8 -*-
 from typing import Optional
-import cantera as ct
+from typing import Union
+import numpy as np
+
+# Values of `cantera.one_atm` [Pa] and `cantera.gas_constant` [J/kmol/K],
+# hard-coded to avoid importing Cantera just to read two constants.
+_ONE_ATM = 101325.0
+_GAS_CONSTANT = 8314.46261815324
+
+# Conversion of Scm³/min to Sm³/s.
+_M3_PER_S_PER_SCCM = 1 / (60 * 10**6)
 
 
 class FlowUnits:
@@ -8,7 +17,9 @@ class FlowUnits:
 
     Conversion is performed assuming ideal gas law. Concentration at normal
     condition is multiplied by gas molar weight and this value is used as
-    base conversion factor.
+    base conversion factor. Conversion methods accept NumPy arrays for any
+    of the operating conditions and broadcast them, so that a whole sweep
+    of operating points is converted in a single call.
 
     Attributes
     ----------
@@ -16,72 +27,69 @@ class FlowUnits:
         Reference temperature for normal conditions, default is 288.15 K.
     T_STANDARD: float = 273.15
         Reference temperature for standard conditions, default is 273.15 K.
-    P_STANDARD: float = ct.one_atm
+    P_STANDARD: float = 101325.0
         Reference pressure for standard conditions, default is 101325 Pa.
     """
     T_NORMAL: float = 288.15
     T_STANDARD: float = 273.15
-    P_STANDARD: float = ct.one_atm
+    P_STANDARD: float = _ONE_ATM
 
     @property
     def normal_concentration(self) -> float:
         """ Ideal gas concentration at normal conditions [kmol/m³]. """
-        den = ct.gas_constant * self.__class__.T_NORMAL
+        den = _GAS_CONSTANT * self.__class__.T_NORMAL
         return self.__class__.P_STANDARD / den
 
     def normal_flow_to_mass_flow(
             self,
-            q: float,
-            mw: float
-        ) -> float:
+            q: Union[float, np.ndarray],
+            mw: Union[float, np.ndarray]
+        ) -> Union[float, np.ndarray]:
         """ Convert flow given in Nm³/h to kg/s for a solution.
         
         Parameters
         ----------
-        q: float
+        q: Union[float, np.ndarray]
             Flow rate to be converted in Nm³/h.
-        mw: float
+        mw: Union[float, np.ndarray]
             Solution mean molecular weight in kg/kmol.
 
         Returns
         -------
-        float
+        Union[float, np.ndarray]
             Flow rate converted to kg/s.
         """
         return self.normal_concentration * mw * q / 3600
 
     def standard_flow_to_gas_speed(
             self, 
-            q: float,
-            T_work: Optional[float] = 298.15,
-            P_work: Optional[float] = ct.one_atm,
-            A_cross: Optional[float] = 1.0
-        ) -> float:
+            q: Union[float, np.ndarray],
+            T_work: Optional[Union[float, np.ndarray]] = 298.15,
+            P_work: Optional[Union[float, np.ndarray]] = _ONE_ATM,
+            A_cross: Optional[Union[float, np.ndarray]] = 1.0
+        ) -> Union[float, np.ndarray]:
         """ Convert laboratory gas flow in Scm³/min to mean speed in m/s.
 
         Parameters
         ----------
-        q: float
+        q: Union[float, np.ndarray]
             Flow rate to be converted in Scm³/min (sccm).
-        T_work: Optional[float] = 298.15
+        T_work: Optional[Union[float, np.ndarray]] = 298.15
             Reactor working temperature in kelvin [K].
-        P_work: Optional[float] = ct.one_atm
+        P_work: Optional[Union[float, np.ndarray]] = 101325.0
             Reactor working pressure in pascal [Pa]
-        A_cross: Optional[float] = 1.0
+        A_cross: Optional[Union[float, np.ndarray]] = 1.0
             Reactor cross sectional area in squared meters [m²].
 
         Returns
         -------
-        float
+        Union[float, np.ndarray]
             Equivalent gas speed in meters per second [m/s].
         """
         P = self.__class__.P_STANDARD
         T = self.__class__.T_STANDARD
 
-        min_per_sec = 1 / 60
-        m3_per_cm3 = 1 / 10**6
+        # Scalar factor first so arrays are only traversed by the last ops.
+        K = _M3_PER_S_PER_SCCM * P / T
 
-        Q = q * min_per_sec * m3_per_cm3 * (T_work / P_work) * (P / T)
-        U = Q / A_cross
-        
-        return U
+        return q * K * T_work / (P_work * A_cross)
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
+from contextlib import redirect_stderr
+from contextlib import redirect_stdout
 from io import StringIO
-import sys
 
 
 class Capturing(list):
@@ -12,16 +13,18 @@ class Capturing(list):
     end this context manager is to be used and redirect to a list.
     """
     def __enter__(self):
-        self._stdout = sys.stdout
-        self._stderr = sys.stderr
-        sys.stdout = self._tmpout = StringIO()
-        sys.stderr = self._tmperr = StringIO()
+        self._tmpout = StringIO()
+        self._tmperr = StringIO()
+        self._redout = redirect_stdout(self._tmpout)
+        self._rederr = redirect_stderr(self._tmperr)
+        self._redout.__enter__()
+        self._rederr.__enter__()
         return self
 
     def __exit__(self, *args):
+        self._rederr.__exit__(*args)
+        self._redout.__exit__(*args)
         self.extend(self._tmpout.getvalue().splitlines())
         self.extend(self._tmperr.getvalue().splitlines())
-        del self._tmpout
-        del self._tmperr
-        sys.stdout = self._stdout
-        sys.stderr = self._stderr
+        del self._tmpout, self._tmperr
+        del self._redout, self._rederr
@@ -19,7 +19,7 @@ install_requires = [
     "requests>=2.25.1"
 ]
 
-package_data = {name: []}
+package_data = {"majordome": []}
 
 classifiers = [
     "Development Status :: 3 - Alpha",
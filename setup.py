@@ -3,12 +3,20 @@
 from pathlib import Path
 from setuptools import setup
 from setuptools import find_packages
+import ast
+
+
+def read_metadata(fname):
+    """ Statically evaluate literal assignments of metadata file. """
+    tree = ast.parse(Path(fname).read_text(encoding="utf-8"))
+    return {target.id: ast.literal_eval(node.value)
+            for node in tree.body if isinstance(node, ast.Assign)
+            for target in node.targets if isinstance(target, ast.Name)}
 
-pkg = {}
-with open("majordome/version.py") as fp:
-    exec(fp.read(), pkg)
 
 root = Path(__file__).resolve().parent
+pkg = read_metadata(root / "majordome" / "version.py")
+
 with open(root / "README.md", encoding="utf-8") as f:
     long_description = f.read()
 